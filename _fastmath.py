@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hot numeric kernels shared by the GUI.
+numba is optional: when installed the kernels are JIT-compiled (with an
+on-disk cache so the compile cost is paid once), otherwise the same code
+runs as plain NumPy.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # No-op decorator so the kernels stay importable without numba
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True)
+def compute_rank_buckets(lats: np.ndarray) -> np.ndarray:
+    """Map each latency to its 0-4 quintile bucket (0 = fastest)"""
+    order = np.argsort(lats)
+    n = lats.size
+    out = np.empty(n, np.int8)
+    for k in range(n):
+        bucket = (k * 5) // n
+        if bucket > 4:
+            bucket = 4
+        out[order[k]] = bucket
+    return out
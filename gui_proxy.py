@@ -1,31 +1,38 @@
 import sys
 import os
 import time
-import threading
+import asyncio
 from datetime import datetime
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Set, Optional
 
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QLabel, QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
-    QProgressBar, QGroupBox, QFrame, QSplitter, QListWidget, QStackedWidget,
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QLabel, QPushButton, QTableView, QHeaderView,
+    QProgressBar, QGroupBox, QFrame, QSplitter, QPlainTextEdit, QStackedWidget,
     QMessageBox, QAbstractItemView, QLineEdit, QCheckBox
 )
-from PySide6.QtCore import Qt, Signal, QObject, QTimer, QSize
-from PySide6.QtGui import QColor, QPalette, QFont, QIcon, QBrush
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QObject, QThread, QTimer, QSize, QRect,
+    QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
+from PySide6.QtGui import QColor, QPalette, QFont, QIcon, QBrush, QPainter
 
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import numpy as np
+import aiohttp
 import logging
-import json
+import orjson
 
 # Import our proxy manager
-from party_proxy import ProxyManager, logger
+from party_proxy import ProxyManager, logger, TIMEOUT
+from _fastmath import compute_rank_buckets
+
+# Star strings by rank bucket (best latency quintile first)
+STAR_RANKS = ("⭐⭐⭐⭐⭐", "⭐⭐⭐⭐", "⭐⭐⭐", "⭐⭐", "⭐")
 
 class WorkerSignals(QObject):
     """Signals for background tasks"""
-    progress = Signal(int, int, object)
+    # checked count, total, list of successful results since last emit
+    progress = Signal(int, int, list)
     scraped = Signal(set)
     finished = Signal(list)
     log = Signal(str)
@@ -41,19 +48,21 @@ class QtLoggingHandler(logging.Handler):
         msg = self.format(record)
         self.signal.emit(msg)
 
-class ScrapeWorker(threading.Thread):
-    """Worker thread for background scraping"""
+class ScrapeWorker(QObject):
+    """Background scraper; lives on a QThread via moveToThread"""
     def __init__(self, manager: ProxyManager, signals: WorkerSignals, max_workers: int = 100):
         super().__init__()
         self.manager = manager
         self.signals = signals
         self.max_workers = max_workers
         self._is_running = True
+        self._thread = None  # set by MainWindow._start_worker
 
+    @Slot()
     def run(self):
         try:
             raw_proxies = self.manager.scrape_proxies(
-                cancel_check=self.is_cancelled, 
+                cancel_check=self.is_cancelled,
                 max_workers=self.max_workers
             )
             # Emit regardless of _is_running so partial results are shown on stop
@@ -65,13 +74,20 @@ class ScrapeWorker(threading.Thread):
             self.signals.finished.emit([])
 
     def is_cancelled(self):
-        return not self._is_running
+        thread = self.thread()
+        return (not self._is_running
+                or (thread is not None and thread.isInterruptionRequested()))
+
+    def is_alive(self):
+        return self._thread is not None and self._thread.isRunning()
 
     def stop(self):
         self._is_running = False
+        if self._thread is not None:
+            self._thread.requestInterruption()
 
-class ProxyWorker(threading.Thread):
-    """Worker thread for non-blocking proxy operations"""
+class ProxyWorker(QObject):
+    """Proxy checker driving an asyncio loop; lives on a QThread via moveToThread"""
     def __init__(self, manager: ProxyManager, proxies_to_check: Set[str], signals: WorkerSignals, max_workers: int = 100):
         super().__init__()
         self.manager = manager
@@ -79,55 +95,144 @@ class ProxyWorker(threading.Thread):
         self.signals = signals
         self.max_workers = max_workers
         self._is_running = True
+        self._thread = None  # set by MainWindow._start_worker
+        self._working: List[Dict[str, Any]] = []
 
+    @Slot()
     def run(self):
         try:
-            # We check in batches or one by one to allow interruption
-            working_proxies = []
-            total = len(self.proxies_to_check)
-            checked = 0
-            
-            from concurrent.futures import ThreadPoolExecutor, as_completed
-            
-            self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
-            with self.executor:
-                future_to_proxy = {self.executor.submit(self.manager.check_proxy, proxy): proxy for proxy in self.proxies_to_check}
-                
-                for future in as_completed(future_to_proxy):
-                    if not self._is_running:
-                        self.executor.shutdown(wait=False, cancel_futures=True)
-                        break
-                    
-                    checked += 1
-                    try:
-                        result = future.result()
-                        if result:
-                            working_proxies.append(result)
-                        self.signals.progress.emit(checked, total, result)
-                    except Exception as e:
-                        logger.error(f"Error in future result: {e}")
-            
+            # One event loop instead of max_workers OS threads: each check
+            # is a coroutine gated by a semaphore, so thousands of probes
+            # can be in flight without per-thread stacks
+            asyncio.run(self._check_all())
             if self._is_running:
-                self.signals.finished.emit(working_proxies)
+                self.signals.finished.emit(self._working)
         except Exception as e:
             self.signals.error.emit(str(e))
         finally:
             self.signals.finished.emit([])
 
+    async def _check_all(self):
+        sem = asyncio.Semaphore(self.max_workers)
+        connector = aiohttp.TCPConnector(limit=self.max_workers)
+        timeout = aiohttp.ClientTimeout(total=TIMEOUT)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            total = len(self.proxies_to_check)
+            checked = 0
+            # Coalesce per-proxy results so the GUI thread is not flooded
+            # with one queued event per future
+            batch: List[Dict[str, Any]] = []
+            last_emit = time.monotonic()
+            tasks = [
+                asyncio.create_task(self._check_one(session, sem, proxy))
+                for proxy in self.proxies_to_check
+            ]
+            for future in asyncio.as_completed(tasks):
+                try:
+                    result = await future
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    logger.error(f"Error in check task: {e}")
+                    result = None
+
+                checked += 1
+                if result:
+                    self._working.append(result)
+                    batch.append(result)
+
+                now = time.monotonic()
+                if len(batch) >= 64 or now - last_emit > 0.1:
+                    self.signals.progress.emit(checked, total, batch)
+                    batch = []
+                    last_emit = now
+
+                if self._is_cancelled():
+                    self._is_running = False
+                    for task in tasks:
+                        task.cancel()
+                    break
+
+            if batch or checked:
+                self.signals.progress.emit(checked, total, batch)
+
+    async def _check_one(self, session, sem, proxy):
+        async with sem:
+            if not self._is_running:
+                return None
+            return await self.manager.check_proxy_async(session, proxy)
+
+    def _is_cancelled(self):
+        thread = self.thread()
+        return (not self._is_running
+                or (thread is not None and thread.isInterruptionRequested()))
+
+    def is_alive(self):
+        return self._thread is not None and self._thread.isRunning()
+
     def stop(self):
+        # The as_completed loop observes the flag and cancels pending tasks
         self._is_running = False
-        if hasattr(self, 'executor'):
-            try:
-                self.executor.shutdown(wait=False, cancel_futures=True)
-            except:
-                pass
+        if self._thread is not None:
+            self._thread.requestInterruption()
+
+class PieWidget(QWidget):
+    """Two-slice pie chart drawn directly with QPainter
+
+    Replaces the matplotlib FigureCanvas: for a chart of two integers
+    a full Agg rasterization pass per refresh is pure overhead.
+    """
+    COLORS = ("#2ecc71", "#e74c3c")
+
+    def __init__(self):
+        super().__init__()
+        self._labels = ()
+        self._values = ()
+        self.setMinimumHeight(200)
+
+    def setValues(self, labels, values):
+        self._labels = tuple(labels)
+        self._values = tuple(values)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        total = sum(self._values)
+        if not total:
+            painter.drawText(self.rect(), Qt.AlignCenter, "No Data")
+            return
+
+        rect = self.rect().adjusted(10, 10, -10, -10)
+        side = min(rect.width(), rect.height())
+        square = QRect(
+            rect.x() + (rect.width() - side) // 2,
+            rect.y() + (rect.height() - side) // 2,
+            side, side
+        )
+
+        start = 90 * 16  # Qt angles are in 1/16th of a degree
+        painter.setPen(Qt.NoPen)
+        for value, color in zip(self._values, self.COLORS):
+            span = int(16 * 360 * value / total)
+            painter.setBrush(QBrush(QColor(color)))
+            painter.drawPie(square, start, -span)
+            start -= span
+
+        # Simple legend in the top-left corner
+        painter.setPen(self.palette().color(QPalette.WindowText))
+        for i, (label, value) in enumerate(zip(self._labels, self._values)):
+            pct = 100.0 * value / total
+            painter.drawText(10, 20 + i * 18, f"{label}: {value} ({pct:.1f}%)")
+
 
 class DashboardWidget(QWidget):
     """Dashboard view with charts and stats"""
     def __init__(self):
         super().__init__()
         self.layout = QVBoxLayout(self)
-        
+
         # Stats Cards
         self.stats_layout = QHBoxLayout()
         self.total_card = self.create_stat_card("Total Proxies", "0", "#3498db")
@@ -137,27 +242,36 @@ class DashboardWidget(QWidget):
         self.stats_layout.addWidget(self.active_card)
         self.stats_layout.addWidget(self.latency_card)
         self.layout.addLayout(self.stats_layout)
-        
+
         # Charts Area
         self.chart_frame = QFrame()
         self.chart_layout = QHBoxLayout(self.chart_frame)
-        
-        self.figure, self.ax = plt.subplots(figsize=(5, 4), tight_layout=True)
-        self.canvas = FigureCanvas(self.figure)
-        self.chart_layout.addWidget(self.canvas)
-        
+
+        self.pie = PieWidget()
+        self.chart_layout.addWidget(self.pie)
+
         self.layout.addWidget(self.chart_frame)
         self.update_chart([], [])
 
+    # One pair of fonts shared by all stat cards
+    _FONTS = None
+
+    @classmethod
+    def _card_fonts(cls):
+        if cls._FONTS is None:
+            cls._FONTS = (QFont("Segoe UI", 10), QFont("Segoe UI", 20, QFont.Bold))
+        return cls._FONTS
+
     def create_stat_card(self, title, value, color):
+        title_font, value_font = self._card_fonts()
         card = QFrame()
         card.setFrameShape(QFrame.StyledPanel)
         card.setStyleSheet(f"background-color: {color}; border-radius: 10px; color: white;")
         layout = QVBoxLayout(card)
         title_label = QLabel(title)
-        title_label.setFont(QFont("Segoe UI", 10))
+        title_label.setFont(title_font)
         value_label = QLabel(value)
-        value_label.setFont(QFont("Segoe UI", 20, QFont.Bold))
+        value_label.setFont(value_font)
         layout.addWidget(title_label)
         layout.addWidget(value_label)
         card.value_label = value_label # Save reference
@@ -169,89 +283,164 @@ class DashboardWidget(QWidget):
         self.latency_card.value_label.setText(f"{avg_latency:.0f} ms")
 
     def update_chart(self, labels, values):
-        self.ax.clear()
-        if not values or sum(values) == 0:
-            self.ax.text(0.5, 0.5, "No Data", ha='center', va='center')
-        else:
-            self.ax.pie(values, labels=labels, autopct='%1.1f%%', colors=['#2ecc71', '#e74c3c', '#95a5a6'])
-        self.canvas.draw()
-
-class ProxyTableWidget(QTableWidget):
-    """Proxy list with filtering and selection"""
-    def __init__(self):
-        super().__init__(0, 6)
-        self.setHorizontalHeaderLabels(["Proxy", "Country", "Privacy", "Latency", "Rank", "Last Check"])
-        self.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
-        self.setSortingEnabled(True)  # Enable column sorting
-
-    def add_proxy_row(self, proxy_info: Dict[str, Any]):
-        # Temporarily disable sorting to prevent None errors during addition
-        was_sorting = self.isSortingEnabled()
-        self.setSortingEnabled(False)
-        
-        row = self.rowCount()
-        self.insertRow(row)
-        
-        proxy_item = QTableWidgetItem(proxy_info['proxy'])
-        proxy_item.setData(Qt.UserRole, proxy_info.get('status', 'active'))
-        self.setItem(row, 0, proxy_item)
-        
-        self.setItem(row, 1, QTableWidgetItem(f"{proxy_info.get('countryCode', '??')} {proxy_info.get('country', 'Unknown')}"))
-        self.setItem(row, 2, QTableWidgetItem(proxy_info.get('privacy', 'Unknown')))
-        self.setItem(row, 3, QTableWidgetItem(f"{proxy_info['latency']} ms"))
-        
-        # Rank placeholder
-        rank_item = QTableWidgetItem("")
-        rank_item.setTextAlignment(Qt.AlignCenter)
-        self.setItem(row, 4, rank_item)
-        
-        self.setItem(row, 5, QTableWidgetItem(proxy_info.get('last_check', 'N/A')))
-        
-        # Color based on latency
-        color = QColor("#2ecc71") if proxy_info['latency'] < 500 else QColor("#f1c40f")
-        if proxy_info['latency'] > 1000: color = QColor("#e67e22")
-        self.item(row, 3).setForeground(QBrush(color))
-        
-        # Re-enable sorting if it was enabled
-        self.setSortingEnabled(was_sorting)
+        self.pie.setValues(labels, values)
+
+class ProxyTableModel(QAbstractTableModel):
+    """Table model over a plain list of proxy dicts
+
+    QTableWidget allocated six QTableWidgetItems per proxy; with the
+    model/view split only visible cells are materialized and sort/filter
+    run against the raw Python data.
+    """
+    HEADERS = ("Proxy", "Country", "Privacy", "Latency", "Rank", "Last Check")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Dict[str, Any]] = []
+        self._row_by_proxy: Dict[str, int] = {}
+
+    # --- Qt model interface ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        info = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.DisplayRole:
+            if col == 0: return info['proxy']
+            if col == 1: return f"{info.get('countryCode', '??')} {info.get('country', 'Unknown')}"
+            if col == 2: return info.get('privacy', 'Unknown')
+            if col == 3: return f"{info.get('latency', 0)} ms"
+            if col == 4: return info.get('rank', '')
+            if col == 5: return info.get('last_check', 'N/A')
+        elif role == Qt.ForegroundRole and col == 3:
+            return self._latency_brush(info.get('latency', 0))
+        elif role == Qt.TextAlignmentRole and col == 4:
+            return Qt.AlignCenter
+        elif role == Qt.UserRole:
+            return info.get('status', 'active')
+        return None
+
+    # --- mutation API used by MainWindow ---
+
+    def row_info(self, row: int) -> Dict[str, Any]:
+        return self._rows[row]
+
+    def row_for_proxy(self, proxy: str) -> Optional[int]:
+        return self._row_by_proxy.get(proxy)
+
+    def proxies(self) -> Set[str]:
+        return set(self._row_by_proxy)
+
+    def append_row(self, info: Dict[str, Any]):
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(info)
+        self._row_by_proxy[info['proxy']] = row
+        self.endInsertRows()
+
+    def extend_rows(self, infos: List[Dict[str, Any]]):
+        """Insert a batch of rows with a single begin/endInsertRows"""
+        if not infos:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(infos) - 1)
+        for info in infos:
+            self._row_by_proxy[info['proxy']] = len(self._rows)
+            self._rows.append(info)
+        self.endInsertRows()
+
+    def update_row(self, row: int, info: Dict[str, Any]):
+        rank = self._rows[row].get('rank')
+        self._rows[row] = info
+        if rank is not None:
+            info.setdefault('rank', rank)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def set_status(self, row: int, status: str):
+        self._rows[row]['status'] = status
+        idx = self.index(row, 0)
+        self.dataChanged.emit(idx, idx, [Qt.UserRole])
+
+    def remove_rows(self, rows: List[int]):
+        """Remove rows (source indices) and rebuild the index map once"""
+        for row in sorted(rows, reverse=True):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            info = self._rows.pop(row)
+            self._row_by_proxy.pop(info['proxy'], None)
+            self.endRemoveRows()
+        self._row_by_proxy = {info['proxy']: i for i, info in enumerate(self._rows)}
 
     def update_rankings(self):
         """Update star rankings based on relative latencies"""
-        row_count = self.rowCount()
-        active_latencies = []
-        
-        for i in range(row_count):
-            item = self.item(i, 3)
-            if not item:  # Skip if item is None
-                continue
-            lat_text = item.text().replace(' ms', '')
-            try:
-                # Latency can be a float
-                lat = float(lat_text)
-                if lat > 0:
-                    active_latencies.append((i, lat))
-            except:
-                continue
-        
-        if not active_latencies:
+        rows = []
+        lats = []
+        for i, info in enumerate(self._rows):
+            lat = info.get('latency')
+            if lat:
+                rows.append(i)
+                lats.append(lat)
+
+        if not rows:
             return
-            
-        # Sort by latency
-        active_latencies.sort(key=lambda x: x[1])
-        total = len(active_latencies)
-        
-        for idx, (row, lat) in enumerate(active_latencies):
-            # Calculate stars (relative rank)
-            percentile = (idx / total)
-            if percentile < 0.2: stars = "⭐⭐⭐⭐⭐"
-            elif percentile < 0.4: stars = "⭐⭐⭐⭐"
-            elif percentile < 0.6: stars = "⭐⭐⭐"
-            elif percentile < 0.8: stars = "⭐⭐"
-            else: stars = "⭐"
-            
-            self.item(row, 4).setText(stars)
+
+        # Rank buckets computed in the compiled kernel (numba when
+        # available, NumPy otherwise); buckets[i] belongs to rows[i]
+        buckets = compute_rank_buckets(np.asarray(lats, dtype=np.float64))
+
+        changed = []
+        for i, row in enumerate(rows):
+            stars = STAR_RANKS[int(buckets[i])]
+            if self._rows[row].get('rank') != stars:
+                self._rows[row]['rank'] = stars
+                changed.append(row)
+
+        if changed:
+            self.dataChanged.emit(
+                self.index(min(changed), 4), self.index(max(changed), 4), [Qt.DisplayRole]
+            )
+
+    # Shared brushes, built once on first use (after QApplication exists)
+    # so repaints skip the string -> QColor parse per cell
+    _BRUSHES = None
+
+    @classmethod
+    def _latency_brush(cls, latency) -> QBrush:
+        if cls._BRUSHES is None:
+            cls._BRUSHES = (
+                QBrush(QColor("#2ecc71")),  # fast
+                QBrush(QColor("#f1c40f")),  # medium
+                QBrush(QColor("#e67e22")),  # slow
+            )
+        green, yellow, orange = cls._BRUSHES
+        if latency > 1000:
+            return orange
+        return green if latency < 500 else yellow
+
+
+class ProxySortFilterProxyModel(QSortFilterProxyModel):
+    """Sort/filter layer that compares raw dict values, not display text"""
+
+    def lessThan(self, left, right):
+        model = self.sourceModel()
+        col = left.column()
+        if col == 3:  # latency: numeric compare instead of "123.4 ms" strings
+            a = model.row_info(left.row()).get('latency') or 0
+            b = model.row_info(right.row()).get('latency') or 0
+            return a < b
+        return super().lessThan(left, right)
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -261,9 +450,29 @@ class MainWindow(QMainWindow):
         
         self.manager = ProxyManager()
         self.active_proxies: List[Dict[str, Any]] = []
-        self.proxy_set: Set[str] = set()
+        # Canonical proxy -> record store; the table model is a view of
+        # these same dicts, so there is nothing to re-parse at shutdown
+        self._proxies: Dict[str, Dict[str, Any]] = {}
         self.current_worker = None
-        
+
+        # Batch incoming check results so the table/chart refresh at ~4 Hz
+        # instead of once per proxy (thousands of redraws during a fast scan)
+        self._pending_results: List[Dict[str, Any]] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(250)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
+        # Dashboard stats are recomputed at most ~4 Hz while a worker runs;
+        # the timer is stopped when idle so no background CPU is burned
+        self._stats_dirty = False
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setInterval(250)
+        self._stats_timer.timeout.connect(self._maybe_refresh_stats)
+
+        # Running counters so update_dashboard_stats is O(1) instead of
+        # rescanning every row; kept in sync on add/update/remove
+        self._stats = {'total': 0, 'active': 0, 'lat_sum': 0.0, 'lat_n': 0}
+
         # Setup Logger redirection
         self.setup_logging()
         
@@ -278,26 +487,13 @@ class MainWindow(QMainWindow):
     def save_proxy_cache(self):
         """Save all proxy data to JSON file"""
         cache_file = os.path.join(self.manager.output_dir, 'proxy_cache.json')
-        proxy_data = []
-        
-        for i in range(self.table.rowCount()):
-            # Skip rows with None items
-            if not all([self.table.item(i, j) for j in range(6)]):
-                continue
-                
-            proxy_data.append({
-                'proxy': self.table.item(i, 0).text(),
-                'status': self.table.item(i, 0).data(Qt.UserRole),
-                'country': self.table.item(i, 1).text().split(' ', 1)[1] if ' ' in self.table.item(i, 1).text() else 'Unknown',
-                'countryCode': self.table.item(i, 1).text().split(' ', 1)[0] if ' ' in self.table.item(i, 1).text() else '??',
-                'privacy': self.table.item(i, 2).text(),
-                'latency': float(self.table.item(i, 3).text().replace(' ms', '')) if 'ms' in self.table.item(i, 3).text() else 0,
-                'last_check': self.table.item(i, 5).text()
-            })
-        
+
+        # The canonical records are already structured; dump them as-is
+        proxy_data = list(self._proxies.values())
+
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(proxy_data, f, indent=2)
+            with open(cache_file, 'wb') as f:
+                f.write(orjson.dumps(proxy_data, option=orjson.OPT_INDENT_2))
             self.log(f"Saved {len(proxy_data)} proxies to cache.")
         except Exception as e:
             logger.error(f"Error saving cache: {e}")
@@ -385,12 +581,40 @@ class MainWindow(QMainWindow):
         self.progress_bar.hide()
         layout.addWidget(self.progress_bar)
         
-        # Table
-        self.table = ProxyTableWidget()
+        # Table: data lives in the model, the view only materializes
+        # visible cells; sorting/filtering happen in the proxy model
+        self.model = ProxyTableModel(self)
+        self.proxy_model = ProxySortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
+        self.proxy_model.setFilterKeyColumn(0)
+        self.proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
+
+        self.table = QTableView()
+        self.table.setModel(self.proxy_model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.table.setSortingEnabled(True)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setDefaultSectionSize(120)
+        header.setStretchLastSection(True)
+        self.table.setColumnWidth(0, 180)  # proxy column needs room for ip:port
         layout.addWidget(self.table)
-        
-        # Log view
-        self.log_view = QListWidget()
+
+        # Debounce typing: refilter once per pause, not per keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(
+            lambda: self.proxy_model.setFilterFixedString(self.search_input.text())
+        )
+        self.search_input.textChanged.connect(lambda _: self._filter_timer.start())
+        
+        # Log view - plain text with a bounded block count so multi-hour
+        # scans don't accumulate one widget item per message
+        self.log_view = QPlainTextEdit()
+        self.log_view.setReadOnly(True)
+        self.log_view.setMaximumBlockCount(500)
         self.log_view.setMaximumHeight(100)
         layout.addWidget(self.log_view)
         
@@ -403,41 +627,58 @@ class MainWindow(QMainWindow):
     def load_initial_data(self):
         """Load proxies from JSON cache if available, otherwise from txt"""
         cache_file = os.path.join(self.manager.output_dir, 'proxy_cache.json')
-        
+
+        proxy_data = None
         # Try to load from JSON first
         if os.path.exists(cache_file):
             try:
-                with open(cache_file, 'r') as f:
-                    proxy_data = json.load(f)
-                
+                with open(cache_file, 'rb') as f:
+                    proxy_data = orjson.loads(f.read())
                 self.log(f"Loaded {len(proxy_data)} proxies from cache.")
-                for p in proxy_data:
-                    self.proxy_set.add(p['proxy'])
-                    self.table.add_proxy_row(p)
-                return
             except Exception as e:
                 logger.error(f"Error loading JSON cache: {e}")
-        
-        # Fallback to txt file
-        cached = self.manager.load_cached_proxies()
-        self.log(f"Loaded {len(cached)} proxies from txt cache.")
-        for p in cached:
-            self.proxy_set.add(p)
-            # Fake initial check info for display
-            self.table.add_proxy_row({
-                'proxy': p, 
-                'latency': 0, 
-                'status': 'cached',
-                'country': 'Unknown',
-                'countryCode': '??',
-                'privacy': 'Unknown',
-                'last_check': 'Never'
-            })
+
+        if proxy_data is None:
+            # Fallback to txt file; fake initial check info for display
+            cached = self.manager.load_cached_proxies()
+            self.log(f"Loaded {len(cached)} proxies from txt cache.")
+            proxy_data = [
+                {
+                    'proxy': p,
+                    'latency': 0,
+                    'status': 'cached',
+                    'country': 'Unknown',
+                    'countryCode': '??',
+                    'privacy': 'Unknown',
+                    'last_check': 'Never'
+                }
+                for p in cached
+            ]
+
+        # Stream rows into the model in chunks after the first paint so a
+        # large cache doesn't block the window from appearing
+        self._pending_initial = iter(proxy_data)
+        QTimer.singleShot(0, self._drain_initial)
+
+    def _drain_initial(self):
+        batch = []
+        for info in self._pending_initial:
+            self._proxies[info['proxy']] = info
+            self._stats_add(info)
+            batch.append(info)
+            if len(batch) >= 500:
+                break
+        self.model.extend_rows(batch)
+
+        if len(batch) >= 500:
+            QTimer.singleShot(0, self._drain_initial)
+        else:
+            self._pending_initial = iter(())
+            self.update_dashboard_stats()
 
     def log(self, text):
-        item = f"[{datetime.now().strftime('%H:%M:%S')}] {text}"
-        self.log_view.addItem(item)
-        self.log_view.scrollToBottom()
+        # appendPlainText auto-scrolls while the cursor sits at the end
+        self.log_view.appendPlainText(f"[{datetime.now().strftime('%H:%M:%S')}] {text}")
 
     def toggle_scrape_only(self):
         if self.current_worker and self.current_worker.is_alive():
@@ -456,8 +697,22 @@ class MainWindow(QMainWindow):
         signals.finished.connect(self.on_operation_finished)
         signals.error.connect(self.on_worker_error)
         
-        self.current_worker = ScrapeWorker(self.manager, signals, max_workers=max_workers)
-        self.current_worker.start()
+        self._stats_timer.start()
+        self._start_worker(ScrapeWorker(self.manager, signals, max_workers=max_workers))
+
+    def _start_worker(self, worker):
+        """Move a worker onto a fresh QThread and start it at low priority"""
+        # Parent the thread to the window so it is not garbage collected
+        # while still running; it only frees itself once it has finished.
+        thread = QThread(self)
+        worker._thread = thread
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.signals.finished.connect(thread.quit)
+        thread.finished.connect(lambda w=worker: setattr(w, '_thread', None))
+        thread.finished.connect(thread.deleteLater)
+        self.current_worker = worker
+        thread.start(QThread.LowPriority)
 
     def get_worker_count(self):
         worker_text = self.workers_input.text().strip()
@@ -468,29 +723,32 @@ class MainWindow(QMainWindow):
         return 100 # Default
 
     def on_proxies_scraped(self, raw_proxies):
-        added_count = 0
-        self.table.setUpdatesEnabled(False)
-        try:
-            for p in raw_proxies:
-                if p not in self.proxy_set:
-                    self.table.add_proxy_row({
-                        'proxy': p, 
-                        'latency': 0, 
-                        'status': 'raw',
-                        'country': 'Unknown',
-                        'countryCode': '??',
-                        'privacy': 'Unknown'
-                    })
-                    self.proxy_set.add(p)
-                    added_count += 1
-        finally:
-            self.table.setUpdatesEnabled(True)
-            
-        self.log(f"Scrape finished. Added {added_count} new proxies.")
-        self.update_dashboard_stats()
+        # Set difference runs in CPython's C set code; the Python loop
+        # below only touches genuinely new proxies
+        new = raw_proxies - self._proxies.keys()
+
+        rows = []
+        for p in new:
+            info = {
+                'proxy': p,
+                'latency': 0,
+                'status': 'raw',
+                'country': 'Unknown',
+                'countryCode': '??',
+                'privacy': 'Unknown'
+            }
+            rows.append(info)
+            self._stats_add(info)
+            self._proxies[p] = info
+        self.model.extend_rows(rows)
+
+        self.log(f"Scrape finished. Added {len(rows)} new proxies.")
+        self._stats_dirty = True
+        if not self._stats_timer.isActive():
+            QTimer.singleShot(0, self._maybe_refresh_stats)
 
     def is_proxy_in_table(self, proxy_str):
-        return proxy_str in self.proxy_set
+        return proxy_str in self._proxies
 
     def toggle_full_scan(self):
         if self.current_worker and self.current_worker.is_alive():
@@ -508,8 +766,8 @@ class MainWindow(QMainWindow):
         signals.scraped.connect(self.start_check_after_scrape)
         signals.error.connect(self.on_worker_error)
         
-        self.current_worker = ScrapeWorker(self.manager, signals, max_workers=max_workers)
-        self.current_worker.start()
+        self._stats_timer.start()
+        self._start_worker(ScrapeWorker(self.manager, signals, max_workers=max_workers))
 
     def start_check_after_scrape(self, raw_proxies):
         self.run_worker(raw_proxies)
@@ -523,6 +781,10 @@ class MainWindow(QMainWindow):
             QTimer.singleShot(1000, self.on_operation_finished)
 
     def on_operation_finished(self):
+        # Flush any outstanding stats refresh, then idle the timer
+        self._maybe_refresh_stats()
+        self._stats_timer.stop()
+
         self.btn_scrape_only.setText("Scrape Only")
         self.btn_scrape_only.setStyleSheet("")
         self.btn_scrape_now.setText("Scrape & Check")
@@ -546,7 +808,7 @@ class MainWindow(QMainWindow):
             self.check_all_proxies()
 
     def check_all_proxies(self):
-        proxies_to_check = {self.table.item(i, 0).text() for i in range(self.table.rowCount())}
+        proxies_to_check = self.model.proxies()
         if not proxies_to_check:
             QMessageBox.information(self, "No proxies", "No proxies in the list to check.")
             return
@@ -567,7 +829,11 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No selection", "Please select one or more proxies.")
             return
         
-        proxies_to_check = {self.table.item(row.row(), 0).text() for row in selected_rows}
+        # Selection indices live in the filter model; map back to the source
+        proxies_to_check = {
+            self.model.row_info(self.proxy_model.mapToSource(row).row())['proxy']
+            for row in selected_rows
+        }
         self.log(f"Checking {len(proxies_to_check)} selected proxies...")
         self.btn_check_selected.setText("Stop Check Selected")
         self.btn_check_selected.setStyleSheet("background-color: #c0392b; color: white;")
@@ -578,67 +844,130 @@ class MainWindow(QMainWindow):
         self.log(f"Launching worker with {max_workers} threads.")
         
         # Mark proxies being checked as 'checking'
-        for i in range(self.table.rowCount()):
-            proxy_str = self.table.item(i, 0).text()
-            if proxy_str in proxies_set:
-                self.table.item(i, 0).setData(Qt.UserRole, 'checking')
+        for proxy_str in proxies_set:
+            row = self.model.row_for_proxy(proxy_str)
+            if row is not None:
+                info = self.model.row_info(row)
+                old_status = info.get('status', 'active')
+                self.model.set_status(row, 'checking')
+                self._stats_on_update(old_status, info.get('latency') or 0,
+                                      {'status': 'checking'})
 
         self.progress_bar.setMaximum(len(proxies_set))
         self.progress_bar.setValue(0)
         self.progress_bar.show()
         
         signals = WorkerSignals()
-        signals.progress.connect(self.on_worker_progress)
+        signals.progress.connect(self.on_worker_progress, Qt.QueuedConnection)
         signals.finished.connect(self.on_worker_finished)
         signals.error.connect(self.on_worker_error)
         
-        self.current_worker = ProxyWorker(self.manager, proxies_set, signals, max_workers=max_workers)
-        self.current_worker.start()
+        self._stats_timer.start()
+        self._start_worker(ProxyWorker(self.manager, proxies_set, signals, max_workers=max_workers))
 
-    def on_worker_progress(self, current, total, result):
+    def on_worker_progress(self, current, total, results):
         self.progress_bar.setValue(current)
-        if result:
+        for result in results:
             self.log(f"✓ Found active: {result['proxy']} ({result['country']}, {result['privacy']}, {result['latency']}ms)")
-            # Update existing or add new
+            # Queue the result; _flush_pending applies the batch on a timer
+            self._pending_results.append(result)
+        if self._pending_results and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending(self):
+        """Apply queued check results in one batch (table + rankings + stats)"""
+        if not self._pending_results:
+            self._flush_timer.stop()
+            return
+
+        pending, self._pending_results = self._pending_results, []
+        for result in pending:
             self.update_table_with_result(result)
-            self.table.update_rankings()
+
+        self.model.update_rankings()
+        self._stats_dirty = True
+
+    def _maybe_refresh_stats(self):
+        if self._stats_dirty:
+            self._stats_dirty = False
             self.update_dashboard_stats()
 
+    def _stats_add(self, info):
+        """Account for a newly inserted row"""
+        s = self._stats
+        s['total'] += 1
+        if info.get('status', 'active') == 'active':
+            s['active'] += 1
+            lat = float(info.get('latency') or 0)
+            if lat:
+                s['lat_sum'] += lat
+                s['lat_n'] += 1
+
+    def _stats_remove(self, status, lat):
+        """Account for a removed row"""
+        s = self._stats
+        s['total'] -= 1
+        if status == 'active':
+            s['active'] -= 1
+            if lat:
+                s['lat_sum'] -= lat
+                s['lat_n'] -= 1
+
+    def _stats_on_update(self, old_status, old_lat, info):
+        """Account for an in-place row update (total unchanged)"""
+        s = self._stats
+        if old_status == 'active':
+            s['active'] -= 1
+            if old_lat:
+                s['lat_sum'] -= old_lat
+                s['lat_n'] -= 1
+        if info.get('status', 'active') == 'active':
+            s['active'] += 1
+            lat = float(info.get('latency') or 0)
+            if lat:
+                s['lat_sum'] += lat
+                s['lat_n'] += 1
+
     def update_table_with_result(self, result):
-        # Update set and handle UI
-        self.proxy_set.add(result['proxy'])
-        
-        # Look for existing row to update
-        for i in range(self.table.rowCount()):
-            if self.table.item(i, 0).text() == result['proxy']:
-                # Update existing row
-                self.table.removeRow(i)
-                break
-        
-        # Add as new row (which is actually updated info)
-        self.table.add_proxy_row(result)
+        self._upsert(result)
+
+    def _upsert(self, info):
+        """Single write path: canonical record store plus the model view"""
+        self._proxies[info['proxy']] = info
+
+        # Update the existing row in place; only brand-new proxies get a row
+        row = self.model.row_for_proxy(info['proxy'])
+        if row is not None:
+            old = self.model.row_info(row)
+            old_status = old.get('status', 'active')
+            old_lat = old.get('latency') or 0
+            self.model.update_row(row, info)
+            self._stats_on_update(old_status, old_lat, info)
+        else:
+            self.model.append_row(info)
+            self._stats_add(info)
 
     def on_worker_finished(self, working_proxies):
+        # Apply any results still queued before sweeping the table
+        self._flush_pending()
+        self._flush_timer.stop()
+
         # Remove only proxies with 'checking' status after checking is complete
         # These are proxies that were checked but failed (never upgraded to 'active')
         rows_to_delete = []
-        for i in range(self.table.rowCount()):
-            status = self.table.item(i, 0).data(Qt.UserRole)
-            if status == 'checking':  # Only remove proxies that were being checked and failed
-                proxy_str = self.table.item(i, 0).text()
-                rows_to_delete.append((i, proxy_str))
-        
-        # Delete rows in reverse order to maintain indices
-        for row, proxy in reversed(rows_to_delete):
-            self.table.removeRow(row)
-            self.proxy_set.discard(proxy)
-            
+        for i in range(self.model.rowCount()):
+            info = self.model.row_info(i)
+            if info.get('status') == 'checking':  # checked but never upgraded to 'active'
+                rows_to_delete.append((i, info['proxy'], info.get('latency') or 0))
+
         if rows_to_delete:
+            self.model.remove_rows([row for row, _, _ in rows_to_delete])
+            for _, proxy, lat in rows_to_delete:
+                self._proxies.pop(proxy, None)
+                self._stats_remove('checking', lat)
             self.log(f"Removed {len(rows_to_delete)} dead proxies from list.")
-        
-        # Count actual active proxies in table
-        active_count = sum(1 for i in range(self.table.rowCount()) 
-                          if self.table.item(i, 0).data(Qt.UserRole) == 'active')
+
+        active_count = self._stats['active']
         
         self.on_operation_finished()
         if working_proxies:  # Only save if we have proxies to save
@@ -647,33 +976,16 @@ class MainWindow(QMainWindow):
         self.update_dashboard_stats()
 
     def update_dashboard_stats(self):
-        row_count = self.table.rowCount()
-        active_count = 0
-        latencies = []
-        
-        for i in range(row_count):
-            # Skip rows with None items
-            if not self.table.item(i, 0) or not self.table.item(i, 3):
-                continue
-                
-            status = self.table.item(i, 0).data(Qt.UserRole)
-            if status == 'active':
-                active_count += 1
-                lat_text = self.table.item(i, 3).text().split(' ')[0]
-                try:
-                    # Latency can be a float
-                    latencies.append(float(lat_text))
-                except:
-                    pass
-        
-        avg_latency = np.mean(latencies) if latencies else 0
-        self.dashboard_view.update_stats(row_count, active_count, avg_latency)
-        
+        # O(1): read the running counters instead of rescanning the table
+        s = self._stats
+        avg_latency = s['lat_sum'] / s['lat_n'] if s['lat_n'] else 0
+        self.dashboard_view.update_stats(s['total'], s['active'], avg_latency)
+
         # Chart: Active vs Inactive (here using cached as inactive for simplicity)
         labels = ['Active', 'Other']
-        values = [active_count, row_count - active_count]
+        values = [s['active'], s['total'] - s['active']]
         self.dashboard_view.update_chart(labels, values)
-        self.table.update_rankings()
+        self.model.update_rankings()
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -7,105 +7,293 @@ Supports HTTP, HTTPS, and SOCKS protocols
 
 import os
 import re
+import sys
 import time
+import socket
+import asyncio
 import logging
+import threading
 import requests
+import aiohttp
 import json
+import errno
+import orjson
+import numpy as np
+
+try:
+    from aiohttp_socks import ProxyConnector
+except ImportError:
+    # SOCKS checks fall back to the threaded requests + pysocks path
+    ProxyConnector = None
+
+try:
+    import maxminddb
+except ImportError:
+    # GeoIP falls back to the ip-api.com HTTP lookups
+    maxminddb = None
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Set, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import List, Set, Dict, Any, Optional, Tuple
 from urllib.parse import urlparse
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'  # skip the default msec suffix formatting
 )
 logger = logging.getLogger(__name__)
 
 # Constants
 OUTPUT_DIR = "output"
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, "active_proxies.txt")
+GEOIP_DB = "GeoLite2-City.mmdb"  # optional local MaxMind database
 TIMEOUT = 5  # seconds for proxy check
-MAX_WORKERS = 100  # concurrent threads for checking
-CHECK_URL = "http://www.google.com"
-CHECK_URL_HTTPS = "https://www.google.com"
+TCP_TIMEOUT = 2  # seconds for the raw TCP prefilter probe
+# Size concurrency against the process FD budget: every in-flight check
+# holds a socket, and blowing past RLIMIT_NOFILE surfaces as EMFILE
+# failures that misclassify live proxies as dead. Raise the soft limit
+# toward the hard cap first, then leave headroom for everything else
+# (log files, cached sessions, the event loop's pipes).
+try:
+    import resource
+    _soft, _hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if _soft < _hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (min(65535, _hard), _hard))
+            _soft = min(65535, _hard)
+        except (ValueError, OSError):
+            pass
+    MAX_WORKERS = max(16, min(1024, _soft - 128))
+except ImportError:  # resource is POSIX-only
+    MAX_WORKERS = 100
+# Header-echo endpoint (~300 B body): one request proves connectivity
+# AND yields the anonymity level + exit IP, so no second probe is needed
+CHECK_URL = "http://httpbin.org/get"
+CHECK_URL_HTTPS = "https://httpbin.org/get"
 
 # Proxy sources - free public proxy lists
-PROXY_SOURCES = [
+PROXY_SOURCES: Tuple[Tuple[str, str], ...] = (
     # HTTP
-    "https://api.proxyscrape.com/v2/?request=get&protocol=http&timeout=10000&country=all&ssl=all&anonymity=all",
-    "https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/protocols/http/data.txt",
-    "https://raw.githubusercontent.com/mmpx12/proxy-list/master/http.txt",
-    "https://raw.githubusercontent.com/Zaeem20/FREE_PROXIES_LIST/master/http.txt",
-    "https://raw.githubusercontent.com/ALIILAPRO/Proxy/main/http.txt",
-    "https://raw.githubusercontent.com/sunny9577/proxy-scraper/master/generated/http_proxies.txt",
-    "https://raw.githubusercontent.com/mzyui/proxy-list/main/http.txt",
-    "https://raw.githubusercontent.com/vakhov/fresh-proxy-list/master/http.txt",
-    "https://raw.githubusercontent.com/elliottophellia/proxylist/master/results/http/global/http_checked.txt",
-    "https://raw.githubusercontent.com/zloi-user/hideip.me/master/http.txt",
-    "https://raw.githubusercontent.com/dpangestuw/Free-Proxy/main/http_proxies.txt",
-    "https://raw.githubusercontent.com/casa-ls/proxy-list/main/http",
-    "https://raw.githubusercontent.com/SevenworksDev/proxy-list/main/proxies/http.txt",
-    "https://raw.githubusercontent.com/TheSpeedX/PROXY-List/master/http.txt",
-    "https://raw.githubusercontent.com/ShiftyTR/Proxy-List/master/http.txt",
+    ("http", "https://api.proxyscrape.com/v2/?request=get&protocol=http&timeout=10000&country=all&ssl=all&anonymity=all"),
+    ("http", "https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/protocols/http/data.txt"),
+    ("http", "https://raw.githubusercontent.com/mmpx12/proxy-list/master/http.txt"),
+    ("http", "https://raw.githubusercontent.com/Zaeem20/FREE_PROXIES_LIST/master/http.txt"),
+    ("http", "https://raw.githubusercontent.com/ALIILAPRO/Proxy/main/http.txt"),
+    ("http", "https://raw.githubusercontent.com/sunny9577/proxy-scraper/master/generated/http_proxies.txt"),
+    ("http", "https://raw.githubusercontent.com/mzyui/proxy-list/main/http.txt"),
+    ("http", "https://raw.githubusercontent.com/vakhov/fresh-proxy-list/master/http.txt"),
+    ("http", "https://raw.githubusercontent.com/elliottophellia/proxylist/master/results/http/global/http_checked.txt"),
+    ("http", "https://raw.githubusercontent.com/zloi-user/hideip.me/master/http.txt"),
+    ("http", "https://raw.githubusercontent.com/dpangestuw/Free-Proxy/main/http_proxies.txt"),
+    ("http", "https://raw.githubusercontent.com/casa-ls/proxy-list/main/http"),
+    ("http", "https://raw.githubusercontent.com/SevenworksDev/proxy-list/main/proxies/http.txt"),
+    ("http", "https://raw.githubusercontent.com/TheSpeedX/PROXY-List/master/http.txt"),
+    ("http", "https://raw.githubusercontent.com/ShiftyTR/Proxy-List/master/http.txt"),
 
     # HTTPS
-    "https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/protocols/https/data.txt",
-    "https://raw.githubusercontent.com/mmpx12/proxy-list/master/https.txt",
-    "https://raw.githubusercontent.com/Zaeem20/FREE_PROXIES_LIST/master/https.txt",
-    "https://raw.githubusercontent.com/vakhov/fresh-proxy-list/master/https.txt",
-    "https://raw.githubusercontent.com/roosterkid/openproxylist/main/HTTPS_RAW.txt",
-    "https://raw.githubusercontent.com/zloi-user/hideip.me/master/https.txt",
-    "https://raw.githubusercontent.com/SevenworksDev/proxy-list/main/proxies/https.txt",
-    "https://raw.githubusercontent.com/ShiftyTR/Proxy-List/master/https.txt",
+    ("http", "https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/protocols/https/data.txt"),
+    ("http", "https://raw.githubusercontent.com/mmpx12/proxy-list/master/https.txt"),
+    ("http", "https://raw.githubusercontent.com/Zaeem20/FREE_PROXIES_LIST/master/https.txt"),
+    ("http", "https://raw.githubusercontent.com/vakhov/fresh-proxy-list/master/https.txt"),
+    ("http", "https://raw.githubusercontent.com/roosterkid/openproxylist/main/HTTPS_RAW.txt"),
+    ("http", "https://raw.githubusercontent.com/zloi-user/hideip.me/master/https.txt"),
+    ("http", "https://raw.githubusercontent.com/SevenworksDev/proxy-list/main/proxies/https.txt"),
+    ("http", "https://raw.githubusercontent.com/ShiftyTR/Proxy-List/master/https.txt"),
 
     # SOCKS4
-    "https://api.proxyscrape.com/v2/?request=get&protocol=socks4&timeout=10000&country=all",
-    "https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/protocols/socks4/data.txt",
-    "https://raw.githubusercontent.com/mmpx12/proxy-list/master/socks4.txt",
-    "https://raw.githubusercontent.com/Zaeem20/FREE_PROXIES_LIST/master/socks4.txt",
-    "https://raw.githubusercontent.com/ALIILAPRO/Proxy/main/socks4.txt",
-    "https://raw.githubusercontent.com/sunny9577/proxy-scraper/master/generated/socks4_proxies.txt",
-    "https://raw.githubusercontent.com/mzyui/proxy-list/main/socks4.txt",
-    "https://raw.githubusercontent.com/vakhov/fresh-proxy-list/master/socks4.txt",
-    "https://raw.githubusercontent.com/roosterkid/openproxylist/main/SOCKS4_RAW.txt",
-    "https://raw.githubusercontent.com/elliottophellia/proxylist/master/results/socks4/global/socks4_checked.txt",
-    "https://raw.githubusercontent.com/zloi-user/hideip.me/master/socks4.txt",
-    "https://raw.githubusercontent.com/dpangestuw/Free-Proxy/main/socks4_proxies.txt",
-    "https://raw.githubusercontent.com/casa-ls/proxy-list/main/socks4",
-    "https://raw.githubusercontent.com/SevenworksDev/proxy-list/main/proxies/socks4.txt",
-    "https://raw.githubusercontent.com/TheSpeedX/PROXY-List/master/socks4.txt",
-    "https://raw.githubusercontent.com/ShiftyTR/Proxy-List/master/socks4.txt",
+    ("socks4", "https://api.proxyscrape.com/v2/?request=get&protocol=socks4&timeout=10000&country=all"),
+    ("socks4", "https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/protocols/socks4/data.txt"),
+    ("socks4", "https://raw.githubusercontent.com/mmpx12/proxy-list/master/socks4.txt"),
+    ("socks4", "https://raw.githubusercontent.com/Zaeem20/FREE_PROXIES_LIST/master/socks4.txt"),
+    ("socks4", "https://raw.githubusercontent.com/ALIILAPRO/Proxy/main/socks4.txt"),
+    ("socks4", "https://raw.githubusercontent.com/sunny9577/proxy-scraper/master/generated/socks4_proxies.txt"),
+    ("socks4", "https://raw.githubusercontent.com/mzyui/proxy-list/main/socks4.txt"),
+    ("socks4", "https://raw.githubusercontent.com/vakhov/fresh-proxy-list/master/socks4.txt"),
+    ("socks4", "https://raw.githubusercontent.com/roosterkid/openproxylist/main/SOCKS4_RAW.txt"),
+    ("socks4", "https://raw.githubusercontent.com/elliottophellia/proxylist/master/results/socks4/global/socks4_checked.txt"),
+    ("socks4", "https://raw.githubusercontent.com/zloi-user/hideip.me/master/socks4.txt"),
+    ("socks4", "https://raw.githubusercontent.com/dpangestuw/Free-Proxy/main/socks4_proxies.txt"),
+    ("socks4", "https://raw.githubusercontent.com/casa-ls/proxy-list/main/socks4"),
+    ("socks4", "https://raw.githubusercontent.com/SevenworksDev/proxy-list/main/proxies/socks4.txt"),
+    ("socks4", "https://raw.githubusercontent.com/TheSpeedX/PROXY-List/master/socks4.txt"),
+    ("socks4", "https://raw.githubusercontent.com/ShiftyTR/Proxy-List/master/socks4.txt"),
 
     # SOCKS5
-    "https://api.proxyscrape.com/v2/?request=get&protocol=socks5&timeout=10000&country=all",
-    "https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/protocols/socks5/data.txt",
-    "https://raw.githubusercontent.com/hookzof/socks5_list/master/proxy.txt",
-    "https://raw.githubusercontent.com/mmpx12/proxy-list/master/socks5.txt",
-    "https://raw.githubusercontent.com/Zaeem20/FREE_PROXIES_LIST/master/socks5.txt",
-    "https://raw.githubusercontent.com/ALIILAPRO/Proxy/main/socks5.txt",
-    "https://raw.githubusercontent.com/sunny9577/proxy-scraper/master/generated/socks5_proxies.txt",
-    "https://raw.githubusercontent.com/mzyui/proxy-list/main/socks5.txt",
-    "https://raw.githubusercontent.com/vakhov/fresh-proxy-list/master/socks5.txt",
-    "https://raw.githubusercontent.com/roosterkid/openproxylist/main/SOCKS5_RAW.txt",
-    "https://raw.githubusercontent.com/elliottophellia/proxylist/master/results/socks5/global/socks5_checked.txt",
-    "https://raw.githubusercontent.com/zloi-user/hideip.me/master/socks5.txt",
-    "https://raw.githubusercontent.com/dpangestuw/Free-Proxy/main/socks5_proxies.txt",
-    "https://raw.githubusercontent.com/casa-ls/proxy-list/main/socks5",
-    "https://raw.githubusercontent.com/SevenworksDev/proxy-list/main/proxies/socks5.txt",
-    "https://raw.githubusercontent.com/TheSpeedX/PROXY-List/master/socks5.txt",
-    "https://raw.githubusercontent.com/ShiftyTR/Proxy-List/master/socks5.txt",
+    ("socks5", "https://api.proxyscrape.com/v2/?request=get&protocol=socks5&timeout=10000&country=all"),
+    ("socks5", "https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/protocols/socks5/data.txt"),
+    ("socks5", "https://raw.githubusercontent.com/hookzof/socks5_list/master/proxy.txt"),
+    ("socks5", "https://raw.githubusercontent.com/mmpx12/proxy-list/master/socks5.txt"),
+    ("socks5", "https://raw.githubusercontent.com/Zaeem20/FREE_PROXIES_LIST/master/socks5.txt"),
+    ("socks5", "https://raw.githubusercontent.com/ALIILAPRO/Proxy/main/socks5.txt"),
+    ("socks5", "https://raw.githubusercontent.com/sunny9577/proxy-scraper/master/generated/socks5_proxies.txt"),
+    ("socks5", "https://raw.githubusercontent.com/mzyui/proxy-list/main/socks5.txt"),
+    ("socks5", "https://raw.githubusercontent.com/vakhov/fresh-proxy-list/master/socks5.txt"),
+    ("socks5", "https://raw.githubusercontent.com/roosterkid/openproxylist/main/SOCKS5_RAW.txt"),
+    ("socks5", "https://raw.githubusercontent.com/elliottophellia/proxylist/master/results/socks5/global/socks5_checked.txt"),
+    ("socks5", "https://raw.githubusercontent.com/zloi-user/hideip.me/master/socks5.txt"),
+    ("socks5", "https://raw.githubusercontent.com/dpangestuw/Free-Proxy/main/socks5_proxies.txt"),
+    ("socks5", "https://raw.githubusercontent.com/casa-ls/proxy-list/main/socks5"),
+    ("socks5", "https://raw.githubusercontent.com/SevenworksDev/proxy-list/main/proxies/socks5.txt"),
+    ("socks5", "https://raw.githubusercontent.com/TheSpeedX/PROXY-List/master/socks5.txt"),
+    ("socks5", "https://raw.githubusercontent.com/ShiftyTR/Proxy-List/master/socks5.txt"),
 
     # MIX
-    "https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/all/data.txt",
-    "https://raw.githubusercontent.com/mmpx12/proxy-list/master/proxies.txt",
-    "https://raw.githubusercontent.com/mzyui/proxy-list/main/all.txt",
-    "https://raw.githubusercontent.com/vakhov/fresh-proxy-list/master/proxylist.txt",
-    "https://raw.githubusercontent.com/themiralay/Proxy-List-World/master/data.txt",
-    "https://raw.githubusercontent.com/gitrecon1455/fresh-proxy-list/main/proxylist.txt",
-    "https://raw.githubusercontent.com/SevenworksDev/proxy-list/main/proxies/unknown.txt",
-]
+    ("http", "https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/all/data.txt"),
+    ("http", "https://raw.githubusercontent.com/mmpx12/proxy-list/master/proxies.txt"),
+    ("http", "https://raw.githubusercontent.com/mzyui/proxy-list/main/all.txt"),
+    ("http", "https://raw.githubusercontent.com/vakhov/fresh-proxy-list/master/proxylist.txt"),
+    ("http", "https://raw.githubusercontent.com/themiralay/Proxy-List-World/master/data.txt"),
+    ("http", "https://raw.githubusercontent.com/gitrecon1455/fresh-proxy-list/main/proxylist.txt"),
+    ("http", "https://raw.githubusercontent.com/SevenworksDev/proxy-list/main/proxies/unknown.txt"),
+)
+
+
+# One pooled session per worker thread: keep-alive reuses the upstream
+# connection across checks instead of paying a TCP/TLS handshake per call
+_tls = threading.local()
+
+
+def get_session() -> requests.Session:
+    """Return this thread's pooled requests session, creating it lazily"""
+    session = getattr(_tls, 'session', None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _tls.session = session
+    return session
+
+
+# Compiled once at import; matches raw bytes so source payloads are
+# scanned without a full utf-8 decode, and the word boundaries avoid
+# matching inside longer digit runs
+_IPPORT_RE = re.compile(rb'\b\d{1,3}(?:\.\d{1,3}){3}:\d{1,5}\b')
+_README_TS_RE = re.compile(r'^\*\*⏰ Última actualización:\*\* .*$', re.MULTILINE)
+
+
+def canonical(proxy: str) -> str:
+    """Normalize an IP:PORT string (strip leading zeros) so '01.2.3.4:080'
+    and '1.2.3.4:80' dedup to the same entry"""
+    ip, port = proxy.rsplit(':', 1)
+    return f"{'.'.join(str(int(o)) for o in ip.split('.'))}:{int(port)}"
+
+
+def _parse_echo(data: Dict[str, Any]) -> Tuple[str, str]:
+    """Derive (privacy, exit_ip) from an httpbin-style header echo
+    exit_ip is the address the proxy NATs out through"""
+    headers = data.get('headers', {})
+    exit_ip = data.get('origin', '').split(',')[0].strip()
+
+    # Check for proxy indicators
+    via = headers.get('Via', '')
+    forwarded = headers.get('X-Forwarded-For', '')
+
+    if not via and not forwarded:
+        return "Elite", exit_ip
+    elif "proxy" in via.lower() or forwarded:
+        return "Anonymous", exit_ip
+    else:
+        return "Transparent", exit_ip
+
+
+def _valid_hostport(hostport: str) -> bool:
+    """Reject regex matches like 999.999.999.999:99999 before they cost
+    a network probe"""
+    ip, port = hostport.rsplit(':', 1)
+    try:
+        socket.inet_aton(ip)  # C-level octet validation
+    except OSError:
+        return False
+    return 0 < int(port) < 65536
+
+
+def split_proxy(proxy: str) -> Tuple[str, str]:
+    """Split 'socks5://1.2.3.4:1080' into ('socks5', '1.2.3.4:1080')
+    Bare IP:PORT strings default to the http scheme"""
+    scheme, _, hostport = proxy.rpartition('://')
+    return (scheme or 'http', hostport)
+
+
+_resolved_check: Optional[Tuple[str, Dict[str, str]]] = None
+_resolve_lock = threading.Lock()
+
+
+def resolved_check_url() -> Tuple[str, Dict[str, str]]:
+    """Resolve CHECK_URL's host once and return (url, extra_headers)
+
+    Workers would otherwise hit getaddrinfo per probe — SOCKS4 proxies in
+    particular force client-side resolution of the target host. Rewriting
+    the URL to the literal IP with a Host header keeps the request
+    equivalent while skipping the resolver entirely.
+    """
+    global _resolved_check
+    if _resolved_check is None:
+        with _resolve_lock:
+            if _resolved_check is None:
+                parsed = urlparse(CHECK_URL)
+                try:
+                    ip = socket.gethostbyname(parsed.hostname)
+                    _resolved_check = (
+                        parsed._replace(netloc=ip).geturl(),
+                        {'Host': parsed.hostname}
+                    )
+                except OSError:
+                    # Resolver unavailable right now; fall back to the name
+                    return CHECK_URL, {}
+    return _resolved_check
+
+
+def _proxy_sort_key(proxy: str) -> int:
+    """Pack IP octets and port into one int so sorting is numeric
+    (lexical sort puts 10.0.0.1 before 2.2.2.2)"""
+    ip, port = split_proxy(proxy)[1].rsplit(':', 1)
+    a, b, c, d = map(int, ip.split('.'))
+    return (a << 40) | (b << 32) | (c << 24) | (d << 16) | int(port)
+
+
+# Errno values that mean WE ran out of sockets/buffers, as opposed to the
+# proxy being dead — the only failures worth throttling over
+_RESOURCE_ERRNOS = {errno.EMFILE, errno.ENFILE, errno.ENOBUFS}
+
+
+class _AdaptiveLimiter:
+    """AIMD gate for in-flight checks
+
+    Additive increase while the host keeps up, multiplicative decrease
+    the moment local resource errors appear, converging on the knee of
+    throughput vs. socket exhaustion instead of trusting a fixed cap.
+    """
+
+    def __init__(self, start: int, ceiling: int, floor: int = 16, step: int = 10):
+        self.limit = min(start, ceiling)
+        self.ceiling = ceiling
+        self.floor = floor
+        self.step = step
+        self._active = 0
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._cond:
+            while self._active >= self.limit:
+                await self._cond.wait()
+            self._active += 1
+
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    async def increase(self):
+        async with self._cond:
+            if self.limit < self.ceiling:
+                self.limit = min(self.limit + self.step, self.ceiling)
+                self._cond.notify(self.step)
+
+    async def backoff(self):
+        async with self._cond:
+            self.limit = max(self.limit // 2, self.floor)
 
 
 class ProxyManager:
@@ -114,40 +302,159 @@ class ProxyManager:
     def __init__(self, output_dir=OUTPUT_DIR, output_file=OUTPUT_FILE):
         self.output_dir = output_dir
         self.output_file = output_file
+        self.scrape_cache_file = os.path.join(output_dir, '.cache.json')
         self.proxies: List[Dict[str, Any]] = []
         self.geoip_cache: Dict[str, Dict[str, Any]] = {}
+        self._resource_errors = 0  # local socket-exhaustion failures since last poll
+        # Memory-mapped GeoLite2 database: lookups become a local B-tree
+        # walk instead of a rate-limited HTTP round-trip per IP
+        self._mmdb = None
+        if maxminddb is not None and os.path.exists(GEOIP_DB):
+            try:
+                self._mmdb = maxminddb.open_database(GEOIP_DB, maxminddb.MODE_MMAP)
+            except (OSError, ValueError) as e:
+                logger.debug("Could not open %s: %s", GEOIP_DB, e)
+        self.geoip_cache_file = os.path.join(output_dir, 'geoip_cache.json')
+        self.results_file = os.path.join(output_dir, 'active_proxies.json')
         self.ensure_output_dir()
+        self._load_geoip_cache()
+
+    def _load_geoip_cache(self):
+        """Seed geoip_cache from disk, dropping entries older than 24h
+        Proxy lists overlap heavily day-to-day, so this removes most geo
+        HTTP traffic on repeat runs"""
+        try:
+            with open(self.geoip_cache_file, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        cutoff = datetime.now().timestamp() - 24 * 3600
+        for ip, info in stored.items():
+            try:
+                if datetime.fromisoformat(info.get('ts', '')).timestamp() > cutoff:
+                    self.geoip_cache[ip] = info
+            except ValueError:
+                continue
+
+    def _save_geoip_cache(self):
+        """Persist geoip_cache atomically (write + rename)"""
+        tmp_path = self.geoip_cache_file + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.geoip_cache, f)
+            os.replace(tmp_path, self.geoip_cache_file)
+        except OSError as e:
+            logger.debug("Could not save GeoIP cache: %s", e)
+
+    def _load_scrape_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load per-source ETag/Last-Modified validators from disk"""
+        try:
+            with open(self.scrape_cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_scrape_cache(self, cache: Dict[str, Dict[str, Any]]):
+        """Persist the scrape cache atomically (write + rename)"""
+        tmp_path = self.scrape_cache_file + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.scrape_cache_file)
+        except OSError as e:
+            logger.debug("Could not save scrape cache: %s", e)
 
     def get_geoip(self, ip: str) -> Dict[str, Any]:
         """Fetch GeoIP info for an IP, with simple caching"""
         if ip in self.geoip_cache:
             return self.geoip_cache[ip]
-        
+
+        # Local mmdb first: sub-microsecond and no 45/min rate limit
+        if self._mmdb is not None:
+            try:
+                record = self._mmdb.get(ip)
+            except ValueError:
+                record = None
+            if record:
+                subdivisions = record.get('subdivisions') or [{}]
+                info = {
+                    'country': record.get('country', {}).get('names', {}).get('en', 'Unknown'),
+                    'countryCode': record.get('country', {}).get('iso_code', '??'),
+                    'region': subdivisions[0].get('names', {}).get('en', ''),
+                    'city': record.get('city', {}).get('names', {}).get('en', ''),
+                    'isp': ''  # not present in the City database
+                }
+                self.geoip_cache[ip] = info
+                return info
+
         try:
             # Use ip-api.com (Limited to 45 per min, but we only call this for active proxies)
-            response = requests.get(f"http://ip-api.com/json/{ip}", timeout=5)
+            response = get_session().get(f"http://ip-api.com/json/{ip}", timeout=5)
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if data.get('status') == 'success':
                     info = {
                         'country': data.get('country', 'Unknown'),
                         'countryCode': data.get('countryCode', '??'),
                         'region': data.get('regionName', ''),
                         'city': data.get('city', ''),
-                        'isp': data.get('isp', '')
+                        'isp': data.get('isp', ''),
+                        'ts': datetime.now().isoformat()
                     }
                     self.geoip_cache[ip] = info
                     return info
         except Exception as e:
-            logger.debug(f"GeoIP error for {ip}: {e}")
+            logger.debug("GeoIP error for %s: %s", ip, e)
         
         return {'country': 'Unknown', 'countryCode': '??'}
 
+    def _note_failure(self, e: BaseException):
+        """Count failures caused by local socket exhaustion rather than a
+        dead proxy — the adaptive limiter keys its backoff on these"""
+        for exc in (e, e.__cause__, e.__context__):
+            if isinstance(exc, OSError) and exc.errno in _RESOURCE_ERRNOS:
+                self._resource_errors += 1
+                return
+
+    def prefetch_geoip(self, ips: List[str]):
+        """Bulk-resolve GeoIP via ip-api.com's /batch endpoint (100 IPs
+        per POST) so later get_geoip calls are cache hits
+
+        No-op when the local mmdb is available - lookups are already free.
+        """
+        if self._mmdb is not None:
+            return
+        pending = [ip for ip in dict.fromkeys(ips) if ip not in self.geoip_cache]
+        for start in range(0, len(pending), 100):
+            chunk = pending[start:start + 100]
+            try:
+                response = get_session().post(
+                    'http://ip-api.com/batch',
+                    json=[{'query': ip, 'fields': 'status,query,country,countryCode,regionName,city,isp'}
+                          for ip in chunk],
+                    timeout=10
+                )
+                if response.status_code != 200:
+                    logger.debug("GeoIP batch failed: %s", response.status_code)
+                    continue
+                for data in orjson.loads(response.content):
+                    if data.get('status') == 'success':
+                        self.geoip_cache[data['query']] = {
+                            'country': data.get('country', 'Unknown'),
+                            'countryCode': data.get('countryCode', '??'),
+                            'region': data.get('regionName', ''),
+                            'city': data.get('city', ''),
+                            'isp': data.get('isp', ''),
+                            'ts': datetime.now().isoformat()
+                        }
+            except Exception as e:
+                logger.debug("GeoIP batch error: %s", e)
+
     def ensure_output_dir(self):
         """Create output directory if it doesn't exist"""
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
-            logger.info(f"Created output directory: {self.output_dir}")
+            logger.info("Created output directory: %s", self.output_dir)
 
     def scrape_proxies(self, cancel_check=None, max_workers=MAX_WORKERS) -> Set[str]:
         """
@@ -156,64 +463,103 @@ class ProxyManager:
         """
         proxies = set()
         logger.info("Starting proxy scraping from sources...")
-        
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        
-        def fetch_source(source):
-            if cancel_check and cancel_check():
-                return set()
-            try:
-                logger.info(f"Fetching from: {source}")
-                response = requests.get(source, timeout=30)
-                if response.status_code == 200:
-                    found = re.findall(r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}:\d{2,5}', response.text)
-                    logger.info(f"Found {len(found)} proxies from {source}")
-                    return set(found)
-                else:
-                    logger.warning(f"Failed to fetch from {source}: {response.status_code}")
-            except Exception as e:
-                logger.error(f"Error fetching from {source}: {e}")
-            return set()
+        cache = self._load_scrape_cache()
 
-        # Concurrent scraping across sources
-        with ThreadPoolExecutor(max_workers=min(len(PROXY_SOURCES), max_workers)) as executor:
-            try:
-                future_to_source = {executor.submit(fetch_source, src): src for src in PROXY_SOURCES}
-                for future in as_completed(future_to_source):
+        async def run_scrape():
+            # ~50 of the sources sit on raw.githubusercontent.com, so a
+            # shared connector capped per host keeps fetches multiplexed
+            # over a handful of warm TLS connections instead of one each
+            sem = asyncio.Semaphore(min(len(PROXY_SOURCES), max_workers, 32))
+            connector = aiohttp.TCPConnector(limit_per_host=4, ttl_dns_cache=300)
+            timeout = aiohttp.ClientTimeout(total=30)
+
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                async def fetch_source(protocol, source):
+                    async with sem:
+                        if cancel_check and cancel_check():
+                            return set()
+                        # Conditional request: a 304 costs a few hundred
+                        # bytes instead of re-downloading the whole list
+                        entry = cache.get(source, {})
+                        headers = {}
+                        if entry.get('etag'):
+                            headers['If-None-Match'] = entry['etag']
+                        if entry.get('last_mod'):
+                            headers['If-Modified-Since'] = entry['last_mod']
+                        try:
+                            logger.debug("Fetching from: %s", source)
+                            async with session.get(source, headers=headers) as response:
+                                if response.status == 304 and entry.get('proxies') is not None:
+                                    logger.debug("Not modified, using cached proxies for %s", source)
+                                    return set(entry['proxies'])
+                                if response.status == 200:
+                                    # Tag non-http proxies with their scheme so the checker
+                                    # can build the right proxy URL instead of guessing http
+                                    prefix = '' if protocol == 'http' else f'{protocol}://'
+                                    result = set()
+
+                                    def scan(buf, cut):
+                                        # Accept matches ending before `cut`; report
+                                        # where the next scan window must start so a
+                                        # match straddling the cut isn't lost
+                                        resume = cut
+                                        for m in _IPPORT_RE.finditer(buf):
+                                            if m.end() > cut:
+                                                resume = min(resume, m.start())
+                                                continue
+                                            candidate = m.group().decode('ascii')
+                                            if _valid_hostport(candidate):
+                                                result.add(prefix + canonical(candidate))
+                                        return resume
+
+                                    # Stream the body in 64 KiB chunks so multi-MB
+                                    # source files never sit in RAM whole; a short
+                                    # tail carries over to cover boundary matches
+                                    tail = b''
+                                    async for chunk in response.content.iter_chunked(65536):
+                                        buf = tail + chunk
+                                        tail = buf[scan(buf, max(len(buf) - 32, 0)):]
+                                    scan(tail, len(tail) + 1)
+
+                                    logger.debug("Found %d proxies from %s", len(result), source)
+                                    cache[source] = {
+                                        'etag': response.headers.get('ETag'),
+                                        'last_mod': response.headers.get('Last-Modified'),
+                                        'proxies': sorted(result)
+                                    }
+                                    return result
+                                else:
+                                    logger.warning("Failed to fetch from %s: %s", source, response.status)
+                        except asyncio.CancelledError:
+                            raise
+                        except Exception as e:
+                            logger.error("Error fetching from %s: %s", source, e)
+                    return set()
+
+                # Dedupe exact repeats and group the fetch order by host so
+                # same-host requests queue back-to-back onto the few warm
+                # connections the per-host cap allows
+                ordered = sorted(dict.fromkeys(PROXY_SOURCES),
+                                 key=lambda pair: urlparse(pair[1]).netloc)
+                tasks = [asyncio.create_task(fetch_source(proto, src)) for proto, src in ordered]
+                for future in asyncio.as_completed(tasks):
                     if cancel_check and cancel_check():
-                        executor.shutdown(wait=False, cancel_futures=True)
+                        for task in tasks:
+                            task.cancel()
                         break
-                    proxies.update(future.result())
-            except KeyboardInterrupt:
-                logger.warning("\nScraping interrupted by user. Processing partial results...")
-                executor.shutdown(wait=False, cancel_futures=True)
-        
-        logger.info(f"Total unique proxies scraped: {len(proxies)}")
-        return proxies
+                    try:
+                        proxies.update(await future)
+                    except asyncio.CancelledError:
+                        pass
 
-    def detect_anonymity(self, proxy: str) -> str:
-        """Detect anonymity level of a proxy"""
         try:
-            proxies = {'http': f'http://{proxy}', 'https': f'http://{proxy}'}
-            # Heuristic check using httpbin
-            response = requests.get('http://httpbin.org/get', proxies=proxies, timeout=TIMEOUT)
-            if response.status_code == 200:
-                data = response.json()
-                headers = data.get('headers', {})
-                
-                # Check for proxy indicators
-                via = headers.get('Via', '')
-                forwarded = headers.get('X-Forwarded-For', '')
-                
-                if not via and not forwarded:
-                    return "Elite"
-                elif "proxy" in via.lower() or forwarded:
-                    return "Anonymous"
-                else:
-                    return "Transparent"
-        except:
-            pass
-        return "Unknown"
+            asyncio.run(run_scrape())
+        except KeyboardInterrupt:
+            logger.warning("\nScraping interrupted by user. Processing partial results...")
+
+        self._save_scrape_cache(cache)
+        logger.info("Total unique proxies scraped: %d", len(proxies))
+        return proxies
 
     def check_proxy(self, proxy: str) -> Dict[str, Any]:
         """
@@ -221,28 +567,40 @@ class ProxyManager:
         Returns dict with proxy info if working, None if not
         """
         try:
+            proto, hostport = split_proxy(proxy)
             proxy_dict = {
-                'http': f'http://{proxy}',
-                'https': f'http://{proxy}'
+                'http': f'{proto}://{hostport}',
+                'https': f'{proto}://{hostport}'
             }
-            
+
             # Step 1: Connectivity and Latency
-            start_time = time.time()
-            response = requests.get(
-                CHECK_URL,
+            check_url, extra_headers = resolved_check_url()
+            # Context manager: the socket goes back to the keep-alive pool
+            # the moment we have status + timing, not whenever GC finalizes
+            with get_session().get(
+                check_url,
+                headers=extra_headers,
                 proxies=proxy_dict,
                 timeout=TIMEOUT,
-                allow_redirects=True
-            )
-            latency = round((time.time() - start_time) * 1000, 2)  # ms
-            
-            if response.status_code == 200:
+                allow_redirects=False  # a redirect already proves forwarding; skip the extra RTT
+            ) as response:
+                # requests already timed the exchange; no need for our own clock
+                latency = round(response.elapsed.total_seconds() * 1000, 2)  # ms
+                status_code = response.status_code
+                privacy, exit_ip = "Unknown", ""
+                if status_code == 200:
+                    try:
+                        # Same response doubles as the anonymity probe
+                        privacy, exit_ip = _parse_echo(orjson.loads(response.content))
+                    except ValueError:
+                        pass
+
+            if 200 <= status_code < 400:
                 # Step 2: Metadata (only for active)
-                ip = proxy.split(':')[0]
+                ip = hostport.split(':')[0]
                 geo = self.get_geoip(ip)
-                privacy = self.detect_anonymity(proxy)
-                
-                logger.debug(f"✓ {proxy} - Working ({geo['country']}, {privacy}, {latency}ms)")
+
+                logger.debug("✓ %s - Working (%s, %s, %sms)", proxy, geo['country'], privacy, latency)
                 return {
                     'proxy': proxy,
                     'latency': latency,
@@ -250,6 +608,7 @@ class ProxyManager:
                     'country': geo['country'],
                     'countryCode': geo['countryCode'],
                     'privacy': privacy,
+                    'exit_ip': exit_ip,
                     'last_check': datetime.now().isoformat()
                 }
             else:
@@ -258,56 +617,313 @@ class ProxyManager:
         except Exception as e:
             # Catch all errors including urllib3.exceptions.HeaderParsingError
             # from malformed proxy responses
-            logger.debug(f"✗ {proxy} - Failed: {type(e).__name__}")
+            self._note_failure(e)
+            logger.debug("✗ %s - Failed: %s", proxy, type(e).__name__)
+            return None
+
+    async def tcp_alive_async(self, proxy: str) -> bool:
+        """Fast L4 probe: is the proxy's TCP port open at all?"""
+        ip, _, port = split_proxy(proxy)[1].rpartition(':')
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(ip, int(port)), timeout=TCP_TIMEOUT
+            )
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+            return True
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            return False
+
+    async def check_proxy_async(self, session: aiohttp.ClientSession, proxy: str) -> Optional[Dict[str, Any]]:
+        """
+        Async variant of check_proxy driven by a shared aiohttp session
+        Returns dict with proxy info if working, None if not
+        """
+        proto, hostport = split_proxy(proxy)
+        if proto != 'http':
+            if ProxyConnector is None:
+                # Without aiohttp-socks, route SOCKS proxies through the
+                # synchronous checker (requests + pysocks)
+                return await asyncio.to_thread(self.check_proxy, proxy)
+            return await self._check_socks_async(proxy, proto, hostport)
+
+        try:
+            # Step 1: Connectivity and Latency
+            check_url, extra_headers = resolved_check_url()
+            start_time = time.time()
+            async with session.get(
+                check_url,
+                headers=extra_headers,
+                proxy=f'http://{hostport}',
+                allow_redirects=False  # a redirect already proves forwarding; skip the extra RTT
+            ) as response:
+                latency = round((time.time() - start_time) * 1000, 2)  # ms
+                if not 200 <= response.status < 400:
+                    return None
+                privacy, exit_ip = "Unknown", ""
+                if response.status == 200:
+                    try:
+                        # Same response doubles as the anonymity probe
+                        privacy, exit_ip = _parse_echo(orjson.loads(await response.read()))
+                    except (aiohttp.ClientError, ValueError):
+                        pass
+
+            return await self._enrich_result(proxy, hostport, latency, privacy, exit_ip)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._note_failure(e)
+            logger.debug("✗ %s - Failed: %s", proxy, type(e).__name__)
+            return None
+
+    async def _check_socks_async(self, proxy: str, proto: str, hostport: str) -> Optional[Dict[str, Any]]:
+        """SOCKS counterpart of check_proxy_async using aiohttp-socks
+        Needs its own short-lived session because the proxy lives in the
+        connector rather than in the request"""
+        try:
+            check_url, extra_headers = resolved_check_url()
+            connector = ProxyConnector.from_url(f'{proto}://{hostport}')
+            timeout = aiohttp.ClientTimeout(total=TIMEOUT)
+            start_time = time.time()
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                async with session.get(
+                    check_url,
+                    headers=extra_headers,
+                    allow_redirects=False
+                ) as response:
+                    latency = round((time.time() - start_time) * 1000, 2)  # ms
+                    if not 200 <= response.status < 400:
+                        return None
+                    privacy, exit_ip = "Unknown", ""
+                    if response.status == 200:
+                        try:
+                            privacy, exit_ip = _parse_echo(orjson.loads(await response.read()))
+                        except (aiohttp.ClientError, ValueError):
+                            pass
+
+            return await self._enrich_result(proxy, hostport, latency, privacy, exit_ip)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._note_failure(e)
+            logger.debug("✗ %s - Failed: %s", proxy, type(e).__name__)
             return None
 
+    async def _enrich_result(self, proxy: str, hostport: str, latency: float,
+                             privacy: str, exit_ip: str) -> Dict[str, Any]:
+        """Build the result dict for a proxy that just passed the probe -
+        the blocking GeoIP lookup runs off the event loop"""
+        ip = hostport.split(':')[0]
+        geo = await asyncio.to_thread(self.get_geoip, ip)
+
+        logger.debug("✓ %s - Working (%s, %s, %sms)", proxy, geo['country'], privacy, latency)
+        return {
+            'proxy': proxy,
+            'latency': latency,
+            'status': 'active',
+            'country': geo['country'],
+            'countryCode': geo['countryCode'],
+            'privacy': privacy,
+            'exit_ip': exit_ip,
+            'last_check': datetime.now().isoformat()
+        }
+
     def check_proxies_concurrent(self, proxies_to_check: Set[str], callback=None) -> List[Dict[str, Any]]:
         """
-        Check proxies concurrently using ThreadPoolExecutor
+        Check proxies concurrently on a single asyncio event loop
         Returns list of working proxy info dicts
         """
-        logger.info(f"Starting concurrent proxy checking with {MAX_WORKERS} workers...")
-        working_proxies = []
+        logger.info("Starting concurrent proxy checking with up to %d connections...", MAX_WORKERS)
+        working_proxies: List[Dict[str, Any]] = []
+        seen: Set[str] = set()  # guards against duplicate results if a proxy is probed twice
         total = len(proxies_to_check)
-        checked = 0
-        
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            try:
-                future_to_proxy = {executor.submit(self.check_proxy, proxy): proxy for proxy in proxies_to_check}
-                
-                for future in as_completed(future_to_proxy):
+        resolved_check_url()  # warm the DNS lookup before the event loop starts
+
+        async def run_checks():
+            sem = asyncio.Semaphore(MAX_WORKERS)
+
+            # Pass 1: cheap TCP connect probe. Most free-list proxies are
+            # dead at L4, so this reclaims the HTTP slots they would burn.
+            async def prefilter(proxy):
+                async with sem:
+                    return proxy if await self.tcp_alive_async(proxy) else None
+
+            survivors = [
+                p for p in await asyncio.gather(*(prefilter(p) for p in proxies_to_check))
+                if p
+            ]
+            logger.info("TCP prefilter: %d/%d proxies have an open port", len(survivors), total)
+
+            # One batched POST per 100 IPs replaces a GET per active proxy;
+            # later get_geoip calls for survivors resolve from the cache
+            await asyncio.to_thread(
+                self.prefetch_geoip,
+                [split_proxy(p)[1].split(':')[0] for p in survivors]
+            )
+
+            # Pass 2: full HTTP probe only on the survivors
+            checked = total - len(survivors)
+            last_report = time.monotonic()
+            connector = aiohttp.TCPConnector(limit=MAX_WORKERS, ttl_dns_cache=300)
+            timeout = aiohttp.ClientTimeout(total=TIMEOUT)
+
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                # Bounded queue + fixed worker pool: in-flight state stays
+                # O(MAX_WORKERS) instead of one pending task per proxy
+                queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_WORKERS * 2)
+
+                def on_checked(result):
+                    nonlocal checked, last_report
+                    if result and result['proxy'] not in seen:
+                        seen.add(result['proxy'])
+                        working_proxies.append(result)
+                        if journal is not None:
+                            # Line-buffered append: survives a mid-run kill
+                            journal.write(result['proxy'] + '\n')
+
                     checked += 1
-                    if checked % 100 == 0 or checked == total:
-                        logger.info(f"Progress: {checked}/{total} proxies checked")
-                    
-                    try:
-                        result = future.result()
-                        if result:
-                            working_proxies.append(result)
-                    except Exception as e:
-                        logger.debug(f"Error checking proxy: {e}")
-                    
+                    # Throttle progress logging: formatting + stderr writes
+                    # add up when thousands of checks complete back-to-back
+                    now = time.monotonic()
+                    if now - last_report > 2.0 or checked == total:
+                        logger.info("Progress: %d/%d proxies checked", checked, total)
+                        last_report = now
+
                     if callback:
                         callback(checked, total, result)
-            except KeyboardInterrupt:
-                logger.warning("\nCheck interrupted by user. Saving partial results...")
-                executor.shutdown(wait=False, cancel_futures=True)
-        
-        logger.info(f"Found {len(working_proxies)} working proxies out of {total}")
+
+                # AIMD feedback: grow in-flight checks while the host keeps
+                # up, halve on local socket exhaustion (EMFILE and friends)
+                limiter = _AdaptiveLimiter(start=100, ceiling=MAX_WORKERS)
+                self._resource_errors = 0
+
+                async def worker():
+                    while True:
+                        proxy = await queue.get()
+                        try:
+                            async with limiter:
+                                result = await self.check_proxy_async(session, proxy)
+                        except Exception as e:
+                            logger.debug("Error checking proxy: %s", e)
+                            result = None
+                        finally:
+                            queue.task_done()
+                        on_checked(result)
+
+                async def adjuster():
+                    while True:
+                        await asyncio.sleep(1.0)
+                        if self._resource_errors:
+                            self._resource_errors = 0
+                            await limiter.backoff()
+                            logger.warning("Resource errors seen; concurrency lowered to %d", limiter.limit)
+                        else:
+                            await limiter.increase()
+
+                workers = [asyncio.create_task(worker()) for _ in range(MAX_WORKERS)]
+                workers.append(asyncio.create_task(adjuster()))
+                try:
+                    for proxy in survivors:
+                        await queue.put(proxy)
+                    await queue.join()
+                finally:
+                    for task in workers:
+                        task.cancel()
+
+        # Journal actives as they are found so a killed run leaves a usable
+        # partial list; save_proxies replaces it with the final dedup'd file
+        try:
+            journal = open(self.output_file + '.partial', 'w', buffering=1)
+        except OSError:
+            journal = None
+
+        try:
+            asyncio.run(run_checks())
+        except KeyboardInterrupt:
+            logger.warning("\nCheck interrupted by user. Saving partial results...")
+        finally:
+            if journal is not None:
+                journal.close()
+
+        # Collapse proxies that NAT out through the same exit IP — they are
+        # functionally identical, so keep only the fastest representative
+        by_exit: Dict[str, Dict[str, Any]] = {}
+        unique: List[Dict[str, Any]] = []
+        for item in working_proxies:
+            exit_ip = item.get('exit_ip')
+            if not exit_ip:
+                unique.append(item)
+            elif exit_ip not in by_exit or item['latency'] < by_exit[exit_ip]['latency']:
+                by_exit[exit_ip] = item
+        if len(by_exit) + len(unique) < len(working_proxies):
+            logger.info("Exit-IP dedup: %d -> %d proxies", len(working_proxies), len(by_exit) + len(unique))
+        working_proxies = unique + list(by_exit.values())
+
+        logger.info("Found %d working proxies out of %d", len(working_proxies), total)
         return working_proxies
 
     def save_proxies(self, working_proxies: List[Dict[str, Any]]):
         """Save working proxies to output file"""
         self.ensure_output_dir()
-        
-        # Sort proxies for consistent output
-        working_proxies.sort(key=lambda x: x['proxy'])
-        
+
+        # Sort proxies numerically by IP/port for consistent output.
+        # The packed int keys live in one contiguous array and argsort
+        # runs at C speed, so the Python key function is called exactly
+        # once per proxy instead of O(n log n) comparisons touching dicts
+        keys = np.fromiter(
+            (_proxy_sort_key(item['proxy']) for item in working_proxies),
+            dtype=np.int64,
+            count=len(working_proxies)
+        )
+        working_proxies[:] = [working_proxies[i] for i in np.argsort(keys, kind='stable')]
+
+        # Single buffered write instead of one syscall per line
         with open(self.output_file, 'w') as f:
-            for item in working_proxies:
-                f.write(f"{item['proxy']}\n")
-        
-        logger.info(f"Saved {len(working_proxies)} proxies to {self.output_file}")
+            f.write('\n'.join(item['proxy'] for item in working_proxies))
+            f.write('\n')
+
+        logger.info("Saved %d proxies to %s", len(working_proxies), self.output_file)
+
+        # The final file supersedes the crash journal
+        try:
+            os.remove(self.output_file + '.partial')
+        except OSError:
+            pass
+
+        # Full result dicts alongside the txt so the next run can skip
+        # re-checking proxies verified moments ago
+        tmp_path = self.results_file + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(working_proxies, f)
+            os.replace(tmp_path, self.results_file)
+        except OSError as e:
+            logger.debug("Could not save results file: %s", e)
+
+        self._save_geoip_cache()
+
+    def load_recent_results(self, max_age: float = 600) -> Dict[str, Dict[str, Any]]:
+        """Return proxy -> result dict for entries checked within max_age
+        seconds, from the results file written by save_proxies"""
+        try:
+            with open(self.results_file, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        cutoff = datetime.now().timestamp() - max_age
+        recent = {}
+        for item in stored:
+            try:
+                if datetime.fromisoformat(item['last_check']).timestamp() > cutoff:
+                    recent[item['proxy']] = item
+            except (KeyError, ValueError):
+                continue
+        return recent
 
     def load_cached_proxies(self) -> List[str]:
         """Load proxies from the output file if it exists"""
@@ -324,32 +940,58 @@ def update_readme_timestamp():
         logger.warning("README.md not found, skipping timestamp update")
         return
     
+    # Get current timestamp (fixed 21-byte format: HH:MM:SS / DD-MM-YYYY)
+    now = datetime.now()
+    timestamp = now.strftime("%H:%M:%S / %d-%m-%Y")
+
     try:
-        with open(readme_path, 'r', encoding='utf-8') as f:
+        # Fast path: the timestamp is fixed-width, so once the line exists
+        # we can patch those bytes in place instead of rewriting the file
+        marker = '**⏰ Última actualización:** '.encode('utf-8')
+        new_ts = timestamp.encode('ascii')
+        with open(readme_path, 'r+b') as f:
             content = f.read()
-        
-        # Get current timestamp
-        now = datetime.now()
-        timestamp = now.strftime("%H:%M:%S / %d-%m-%Y")
-        
-        # Update timestamp line
-        updated_content = re.sub(
-            r'\*\*⏰ Última actualización:\*\* .*',
+            pos = content.find(marker)
+            if pos != -1:
+                start = pos + len(marker)
+                end = content.find(b'\n', start)
+                if end == -1:
+                    end = len(content)
+                if end - start == len(new_ts):
+                    f.seek(start)
+                    f.write(new_ts)
+                    logger.info("Updated README.md timestamp to: %s", timestamp)
+                    return
+
+        # Slow path (first run / malformed line): regex rewrite
+        # (count=1: stop scanning after the match)
+        text = content.decode('utf-8')
+        updated_content = _README_TS_RE.sub(
             f'**⏰ Última actualización:** {timestamp}',
-            content
+            text,
+            count=1
         )
-        
+
         with open(readme_path, 'w', encoding='utf-8') as f:
             f.write(updated_content)
-        
-        logger.info(f"Updated README.md timestamp to: {timestamp}")
-    
+
+        logger.info("Updated README.md timestamp to: %s", timestamp)
+
     except Exception as e:
-        logger.error(f"Error updating README.md: {e}")
+        logger.error("Error updating README.md: %s", e)
 
 
 def main():
     """Main execution flow for CLI"""
+    # Prefer uvloop's libuv event loop when installed: much lower
+    # per-callback overhead with thousands of concurrent sockets
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            logger.debug("uvloop not installed; using the stdlib event loop")
+
     start_time = time.time()
     logger.info("=" * 60)
     logger.info("Party-Proxy: Starting proxy scraping and checking")
@@ -368,13 +1010,19 @@ def main():
             logger.error("No proxies found from sources. Exiting.")
             return
         
-        # Step 2: Check proxies concurrently
-        working_proxies = manager.check_proxies_concurrent(raw_proxies)
-        
+        # Step 2: Check proxies concurrently, skipping candidates that
+        # were already verified within the last 10 minutes
+        recent = manager.load_recent_results()
+        fresh = [recent[p] for p in raw_proxies if p in recent]
+        if fresh:
+            logger.info("Skipping %d proxies verified in the last 10 minutes", len(fresh))
+        working_proxies = manager.check_proxies_concurrent(raw_proxies - recent.keys())
+        working_proxies.extend(fresh)
+
     except KeyboardInterrupt:
         logger.warning("\nExecution stopped by user.")
     except Exception as e:
-        logger.error(f"Fatal error in main execution: {e}")
+        logger.error("Fatal error in main execution: %s", e)
         raise
     finally:
         # Step 3 & 4: Save what we have and update timestamp
@@ -387,12 +1035,12 @@ def main():
         logger.info("=" * 60)
         logger.info("Party-Proxy: Execution finished")
         if 'raw_proxies' in locals():
-            logger.info(f"Total proxies scraped: {len(raw_proxies)}")
+            logger.info("Total proxies scraped: %d", len(raw_proxies))
         if 'working_proxies' in locals():
-            logger.info(f"Working proxies found: {len(working_proxies)}")
+            logger.info("Working proxies found: %d", len(working_proxies))
             if 'raw_proxies' in locals() and raw_proxies:
-                logger.info(f"Success rate: {round(len(working_proxies)/len(raw_proxies)*100, 2)}%")
-        logger.info(f"Total execution time: {elapsed_time} seconds")
+                logger.info("Success rate: %s%%", round(len(working_proxies)/len(raw_proxies)*100, 2))
+        logger.info("Total execution time: %s seconds", elapsed_time)
         logger.info("=" * 60)
 
 